@@ -16,15 +16,20 @@ class MyServiceBase(abc.ABC):
     async def ping(self, stream: grpclib.server.Stream):
         pass
 
+    _mapping_cache = None
+
     def __mapping__(self) -> typing.Dict[str, grpclib.const.Handler]:
-        return {
-            '/MyService/Ping': grpclib.const.Handler(
-                self.ping,
-                grpclib.const.Cardinality.UNARY_UNARY,
-                ping_service_pb.PingRequest,
-                ping_service_pb.PingResponse,
-            ),
-        }
+        if self._mapping_cache is None:
+            self._mapping_cache = {
+                '/MyService/Ping': grpclib.const.Handler(
+                    self.ping,
+                    grpclib.const.Cardinality.UNARY_UNARY,
+                    ping_service_pb.PingRequest,
+                    ping_service_pb.PingResponse,
+                ),
+            }
+
+        return self._mapping_cache
 
 
 class MyServiceStub:
@@ -6,6 +6,8 @@ import protox
 
 
 class PingRequest(protox.Message):
+    __slots__ = ()
+
     counter: int
 
     def __init__(
@@ -13,12 +15,16 @@ class PingRequest(protox.Message):
         *,
         counter: int = None,
     ):
-        super().__init__(
-            counter=counter,
-        )
+        self._data = {}
+        self._which_one_of = {}
+
+        if counter is not None:
+            self.counter = counter
 
 
 class PingResponse(protox.Message):
+    __slots__ = ()
+
     class Status(IntEnum):
         OK = 1
         ERROR = 2
@@ -32,10 +38,13 @@ class PingResponse(protox.Message):
         status: 'PingResponse.Status' = None,
         counter: int = None,
     ):
-        super().__init__(
-            status=status,
-            counter=counter,
-        )
+        self._data = {}
+        self._which_one_of = {}
+
+        if status is not None:
+            self.status = status
+        if counter is not None:
+            self.counter = counter
 
 
 FILE_DESCRIPTOR = protox.FileDescriptorProto.from_bytes(b'\n\x12ping_service.proto"\'\n\x0bPingRequest\x12\x18\n\x07counter\x18\x01 \x02(\x04R\x07counter"s\n\x0cPingResponse\x12,\n\x06status\x18\x01 \x02(\x0e2\x14.PingResponse.StatusR\x06status\x12\x18\n\x07counter\x18\x02 \x02(\x04R\x07counter"\x1b\n\x06Status\x12\x06\n\x02OK\x10\x01\x12\t\n\x05ERROR\x10\x0224\n\tMyService\x12\'\n\x04Ping\x12\x0c.PingRequest\x1a\r.PingResponse(\x000\x00J\xda\x03\n\x06\x12\x04\x00\x00\x12\x01\n\x08\n\x01\x0c\x12\x03\x00\x00\x12\n\n\n\x02\x04\x00\x12\x04\x02\x00\x04\x01\n\n\n\x03\x04\x00\x01\x12\x03\x02\x08\x13\n\x0b\n\x04\x04\x00\x02\x00\x12\x03\x03\x04 \n\x0c\n\x05\x04\x00\x02\x00\x04\x12\x03\x03\x04\x0c\n\x0c\n\x05\x04\x00\x02\x00\x05\x12\x03\x03\r\x13\n\x0c\n\x05\x04\x00\x02\x00\x01\x12\x03\x03\x14\x1b\n\x0c\n\x05\x04\x00\x02\x00\x03\x12\x03\x03\x1e\x1f\n\n\n\x02\x04\x01\x12\x04\x06\x00\x0e\x01\n\n\n\x03\x04\x01\x01\x12\x03\x06\x08\x14\n\x0c\n\x04\x04\x01\x04\x00\x12\x04\x07\x04\n\x05\n\x0c\n\x05\x04\x01\x04\x00\x01\x12\x03\x07\t\x0f\n\r\n\x06\x04\x01\x04\x00\x02\x00\x12\x03\x08\x08\x0f\n\x0e\n\x07\x04\x01\x04\x00\x02\x00\x01\x12\x03\x08\x08\n\n\x0e\n\x07\x04\x01\x04\x00\x02\x00\x02\x12\x03\x08\r\x0e\n\r\n\x06\x04\x01\x04\x00\x02\x01\x12\x03\t\x08\x12\n\x0e\n\x07\x04\x01\x04\x00\x02\x01\x01\x12\x03\t\x08\r\n\x0e\n\x07\x04\x01\x04\x00\x02\x01\x02\x12\x03\t\x10\x11\n\x0b\n\x04\x04\x01\x02\x00\x12\x03\x0c\x04\x1f\n\x0c\n\x05\x04\x01\x02\x00\x04\x12\x03\x0c\x04\x0c\n\x0c\n\x05\x04\x01\x02\x00\x06\x12\x03\x0c\r\x13\n\x0c\n\x05\x04\x01\x02\x00\x01\x12\x03\x0c\x14\x1a\n\x0c\n\x05\x04\x01\x02\x00\x03\x12\x03\x0c\x1d\x1e\n\x0b\n\x04\x04\x01\x02\x01\x12\x03\r\x04 \n\x0c\n\x05\x04\x01\x02\x01\x04\x12\x03\r\x04\x0c\n\x0c\n\x05\x04\x01\x02\x01\x05\x12\x03\r\r\x13\n\x0c\n\x05\x04\x01\x02\x01\x01\x12\x03\r\x14\x1b\n\x0c\n\x05\x04\x01\x02\x01\x03\x12\x03\r\x1e\x1f\n\n\n\x02\x06\x00\x12\x04\x10\x00\x12\x01\n\n\n\x03\x06\x00\x01\x12\x03\x10\x08\x11\n\x0b\n\x04\x06\x00\x02\x00\x12\x03\x11\x042\n\x0c\n\x05\x06\x00\x02\x00\x01\x12\x03\x11\x08\x0c\n\x0c\n\x05\x06\x00\x02\x00\x02\x12\x03\x11\x0e\x19\n\x0c\n\x05\x06\x00\x02\x00\x03\x12\x03\x11$0')
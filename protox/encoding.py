@@ -1,65 +1,192 @@
 import struct
-from typing import IO, Tuple
+import threading
+from typing import Tuple
 
 from protox.exceptions import MessageDecodeError
 
+# reused by encode_varint for multi-byte values; thread-local so
+# concurrent serializers never write into the same scratch buffer
+_scratch = threading.local()
+
 
 def encode_bytes(data: bytes) -> bytes:
     length = encode_varint(len(data))
     return length + data
 
 
-def decode_bytes(stream: IO) -> bytes:
-    length = decode_varint(stream)
-    data = stream.read(length)
+def decode_bytes(data: bytes, position: int = 0) -> Tuple[bytes, int]:
+    length, position = decode_varint(data, position)
+    end = position + length
 
-    if len(data) < length:
+    if end > len(data):
         raise MessageDecodeError(
-            f'Expected to read {length} bytes, {len(data)} bytes read instead'
+            f'Expected to read {length} bytes, {len(data) - position} bytes read instead'
         )
 
-    return data
+    return data[position:end], end
 
 
-def encode_varint(value: int) -> bytes:
-    rv = []
-    x = value & 127
-    value >>= 7
+def decode_bytes_view(data: bytes, position: int = 0) -> Tuple[memoryview, int]:
+    """
+    Like decode_bytes but hands out a zero-copy view of the payload.
+
+    Decoders that transform the payload anyway (e.g. utf-8 decoding)
+    can read straight from the view and skip the intermediate bytes slice
+    """
+    length, position = decode_varint(data, position)
+    end = position + length
+
+    if end > len(data):
+        raise MessageDecodeError(
+            f'Expected to read {length} bytes, {len(data) - position} bytes read instead'
+        )
 
-    while value:
-        rv.append(x | 128)
-        x = value & 127
+    return memoryview(data)[position:end], end
+
+
+def encode_varint_into(out: bytearray, value: int):
+    """
+    Appends the varint encoding of value to a caller-owned buffer
+
+    Lets encoders that already accumulate into a bytearray
+    skip the per-varint bytes allocation
+    """
+    while value > 127:
+        out.append(value & 127 | 128)
         value >>= 7
 
-    rv.append(x)
+    out.append(value)
+
+
+# one- and two-byte varints dominate wire data (field ids, enum
+# values, small counters, length prefixes); hand them out from a
+# prebuilt table instead of encoding and allocating per call
+_varint_cache = tuple(
+    bytes((i,)) if i < 128 else bytes((i & 127 | 128, i >> 7))
+    for i in range(4096)
+)
 
+
+def encode_varint(value: int) -> bytes:
+    if 0 <= value < 4096:
+        return _varint_cache[value]
+
+    try:
+        rv = _scratch.varint_buffer
+    except AttributeError:
+        rv = _scratch.varint_buffer = bytearray()
+
+    rv.clear()
+    encode_varint_into(rv, value)
     return bytes(rv)
 
 
-def decode_varint(stream: IO) -> int:
-    rv = 0
-    shift = 0
+def decode_varint(data: bytes, position: int = 0) -> Tuple[int, int]:
+    """
+    Decodes a varint starting at the given position of the data buffer.
+
+    Walking the buffer with an integer position instead of
+    a stream avoids a method call and a one-byte allocation per byte read.
+
+    Returns the decoded value along with the position right after it
+    """
+    try:
+        x = data[position]
+
+        # most varints on the wire fit a single byte, return it without looping
+        if not x & 128:
+            return x, position + 1
+
+        # two bytes cover values up to 16_383 which includes
+        # most length prefixes, unroll them as well
+        x2 = data[position + 1]
+
+        if not x2 & 128:
+            return (x & 127) | (x2 << 7), position + 2
+    except IndexError:
+        raise MessageDecodeError(
+            'Unexpected end of data when reading varint'
+        )
+
+    rv = (x & 127) | ((x2 & 127) << 7)
+    shift = 14
+    position += 1
 
-    for _ in range(10):
-        x = stream.read(1)
+    for _ in range(8):
+        position += 1
 
-        if x == b'':
+        try:
+            x = data[position]
+        except IndexError:
             raise MessageDecodeError(
-                'Unexpected end of stream when reading varint'
+                'Unexpected end of data when reading varint'
             )
 
-        x = ord(x)
         rv |= (x & 127) << shift
         shift += 7
 
         if not x & 128:
-            return rv
+            return rv, position + 1
 
     raise MessageDecodeError(
         'Exceeded 10 bytes maximum length when reading varint'
     )
 
 
+# schemas reuse the same few (number, wire_type) pairs across sibling
+# messages; since bytes are immutable the encoded tags can be shared
+_tag_cache = {}
+
+
+def encode_tag(tag: int) -> bytes:
+    """
+    Encodes a wire tag (number << 3 | wire_type) to bytes.
+
+    Tags of fields numbered 1..15 — the overwhelmingly common case —
+    fit one byte, fields up to number 2047 fit two; both are built
+    inline without going through the generic varint path. The result
+    is cached per tag and shared between fields
+    """
+    rv = _tag_cache.get(tag)
+
+    if rv is None:
+        if tag < 0x80:
+            rv = bytes((tag,))
+        elif tag < 0x4000:
+            rv = bytes((tag & 0x7f | 0x80, tag >> 7))
+        else:
+            rv = encode_varint(tag)
+
+        _tag_cache[tag] = rv
+
+    return rv
+
+
+def decode_packed_varints(data: bytes, position: int, end: int) -> list:
+    """
+    Decodes the consecutive varints of a packed repeated field
+    between position and end in one pass.
+
+    Batching the loop here amortizes the per-element cost of
+    dispatching through a field's decode method
+    """
+    items = []
+    append = items.append
+
+    while position < end:
+        value, position = decode_varint(data, position)
+        append(value)
+
+    if position > end:
+        # the last varint continued past the declared payload length,
+        # consuming bytes that belong to the next field
+        raise MessageDecodeError(
+            'Unexpected end of data when reading varint'
+        )
+
+    return items
+
+
 def encode_zig_zag32(x: int) -> int:
     return (x << 1) ^ (x >> 31)
 
@@ -72,52 +199,54 @@ def decode_zig_zag(x: int) -> int:
     return (x >> 1) ^ -(x & 1)
 
 
-def decode_header(stream) -> Tuple[int, int]:
-    header = decode_varint(stream)
-    return header >> 3, header & 0b111
+def decode_header(data: bytes, position: int = 0) -> Tuple[int, int, int]:
+    header, position = decode_varint(data, position)
+    return header >> 3, header & 0b111, position
 
 
-def _decode_fixed64(stream):
-    data = stream.read(8)
+_fixed64_struct = struct.Struct('<Q')
+_fixed32_struct = struct.Struct('<I')
 
-    if len(data) != 8:
+
+def _decode_fixed64(data: bytes, position: int = 0) -> Tuple[int, int]:
+    if position + 8 > len(data):
         raise MessageDecodeError(
-            f'Expected to read {8} bytes, got {len(data)} bytes instead'
+            f'Expected to read {8} bytes, got {len(data) - position} bytes instead'
         )
 
-    return struct.unpack('<Q', data)[0]
-
+    return _fixed64_struct.unpack_from(data, position)[0], position + 8
 
-def _decode_fixed32(stream):
-    data = stream.read(4)
 
-    if len(data) != 4:
+def _decode_fixed32(data: bytes, position: int = 0) -> Tuple[int, int]:
+    if position + 4 > len(data):
         raise MessageDecodeError(
-            f'Expected to read {4} bytes, got {len(data)} bytes instead'
+            f'Expected to read {4} bytes, got {len(data) - position} bytes instead'
         )
 
-    return struct.unpack('<I', data)[0]
+    return _fixed32_struct.unpack_from(data, position)[0], position + 4
 
 
-def _decode_group_start(stream):
+def _decode_group_start(data: bytes, position: int = 0):
     # TODO: implement to discard old messages group fields
     raise NotImplementedError(
         'Groups are not supported [deprecated by protobuf]'
     )
 
 
-def _decode_group_end(stream):
+def _decode_group_end(data: bytes, position: int = 0):
     # TODO: implement to discard old messages group fields
     raise NotImplementedError(
         'Groups are not supported [deprecated by protobuf]'
     )
 
 
-wire_type_to_decoder = {
-    0: decode_varint,
-    1: _decode_fixed64,
-    2: decode_bytes,
-    3: _decode_group_start,
-    4: _decode_group_end,
-    5: _decode_fixed32
-}
+# indexed by wire type; a tuple lookup is cheaper than a dict lookup
+# on the per-field dispatch in the decode loop
+wire_type_to_decoder = (
+    decode_varint,
+    _decode_fixed64,
+    decode_bytes,
+    _decode_group_start,
+    _decode_group_end,
+    _decode_fixed32,
+)
@@ -1,15 +1,15 @@
 import enum
-import io
 import struct
 from abc import ABC, abstractmethod
-from typing import IO, Type, Optional, List, Dict, Tuple, Iterable, BinaryIO, Union
+from typing import Type, Optional, List, Dict, Tuple, Iterable, Union
 
 from protox.constants import (
     MIN_INT32, MAX_INT32, MIN_INT64, MAX_INT64, MIN_UINT32,
     MAX_UINT32, MAX_UINT64, MIN_UINT64, MAX_FLOAT, MAX_DOUBLE
 )
 from protox.encoding import (
-    decode_bytes, encode_varint, decode_varint, encode_zig_zag32,
+    decode_bytes, decode_bytes_view, encode_varint, encode_varint_into, encode_tag,
+    decode_varint, decode_packed_varints, encode_zig_zag32,
     decode_zig_zag, encode_zig_zag64, encode_bytes
 )
 from protox.exceptions import MessageDecodeError, FieldValidationError
@@ -56,10 +56,19 @@ class WireType(enum.IntEnum):
     FIXED_32 = 5
 
 
+# plain-int aliases of the WireType members; the field classes store
+# these so wire-tag math and decode dispatch work on raw ints without
+# any enum indirection. WireType stays the public face of the values
+_WT_VARINT = int(WireType.VARINT)
+_WT_FIXED_64 = int(WireType.FIXED_64)
+_WT_LENGTH = int(WireType.LENGTH)
+_WT_FIXED_32 = int(WireType.FIXED_32)
+
+
 def _validate_field_number(number):
-    if number not in range(1, 2 ** 29) or number in range(19_000, 20_000):
+    if not 1 <= number < 2 ** 29 or 19_000 <= number < 20_000:
         raise FieldValidationError(
-            'Field number {} is invalid. '
+            f'Field number {number} is invalid. '
             'A valid field number should be in range [1..2 ** 29 -1] '
             'excluding range [19_000..19_999] '
             'which is reserved for the protobuf implementation'
@@ -67,6 +76,8 @@ def _validate_field_number(number):
 
 
 class Field(ABC):
+    __slots__ = ('number', 'header', 'name')
+
     wire_type: WireType  # provided by subclasses
     number: int
     header: bytes
@@ -74,7 +85,7 @@ class Field(ABC):
     def __init__(self, *, number: int):
         _validate_field_number(number)
         self.number = number
-        self.header = encode_varint(self.number << 3 | self.wire_type)
+        self.header = encode_tag(self.number << 3 | self.wire_type)
         # name is set when adding the field to the message
         self.name: Optional[str] = None
 
@@ -88,8 +99,16 @@ class Field(ABC):
         """
         return self.header + self.encode_value(value)
 
+    def encode_into(self, out: bytearray, value):
+        """
+        Appends the encoded field, header included, to a caller-owned
+        buffer, saving the header + payload concatenation of encode()
+        """
+        out += self.header
+        out += self.encode_value(value)
+
     @abstractmethod
-    def decode(self, stream: IO):
+    def decode(self, data: bytes, position: int = 0):
         raise NotImplementedError()
 
     @abstractmethod
@@ -98,6 +117,8 @@ class Field(ABC):
 
 
 class PrimitiveField(Field, ABC):
+    __slots__ = ('default', 'required')
+
     def __init__(
         self,
         *,
@@ -124,58 +145,179 @@ class PrimitiveField(Field, ABC):
 
 
 class BaseRepeatedStrategy(ABC):
+    __slots__ = ('field', 'number')
+
     def __init__(self, field: Field, number: int):
         self.field = field
         self.number = number
-        self.header = encode_varint(self.field.number << 3 | WireType.LENGTH)
 
     @abstractmethod
     def encode(self, values: list) -> bytes:
         raise NotImplementedError()
 
     @abstractmethod
-    def decode(self, stream: IO):
+    def decode(self, data: bytes, position: int = 0):
         raise NotImplementedError()
 
 
+# marks packed fields whose elements cannot be batch-decoded as varints
+_DECODE_PER_ELEMENT = object()
+
+
+def _finalize_signed_varints(values: list) -> list:
+    return [(x ^ 0x8000_0000_0000_0000) - 0x8000_0000_0000_0000 for x in values]
+
+
+def _finalize_zig_zag_varints(values: list) -> list:
+    return [(x >> 1) ^ -(x & 1) for x in values]
+
+
+def _finalize_bool_varints(values: list) -> list:
+    return [x != 0 for x in values]
+
+
 class PackedRepeatedStrategy(BaseRepeatedStrategy):
-    wire_type = WireType.LENGTH
+    __slots__ = (
+        'header', '_finalize', '_elem_size', '_struct_fmt',
+        '_plain_varint',
+    )
+
+    wire_type = _WT_LENGTH
+
+    def __init__(self, field: Field, number: int):
+        super().__init__(field, number)
+        # the field's own header carries its scalar wire type,
+        # a packed field is encoded as a single length-delimited blob
+        self.header = encode_tag(number << 3 | _WT_LENGTH)
+
+        # varint elements can be decoded in one batch pass over the
+        # buffer; the types below only differ in how the raw varint
+        # is finalized, which a list comprehension handles afterwards
+        field_type = type(field)
+
+        if field_type in (UInt32, UInt64):
+            self._finalize = None
+        elif field_type in (Int32, Int64):
+            self._finalize = _finalize_signed_varints
+        elif field_type in (SInt32, SInt64):
+            self._finalize = _finalize_zig_zag_varints
+        elif field_type is Bool:
+            self._finalize = _finalize_bool_varints
+        elif field_type is EnumField:
+            get_variant = field._variant_by_value.get
+            self._finalize = lambda values: [get_variant(x) for x in values]
+        else:
+            self._finalize = _DECODE_PER_ELEMENT
+
+        # fixed-width elements make the payload length a product of
+        # the element count, and the whole payload can be packed or
+        # unpacked with a single struct call instead of one per element
+        elem = {
+            Bool: (1, '?'),
+            Fixed32: (4, 'I'),
+            SFixed32: (4, 'i'),
+            Float: (4, 'f'),
+            Fixed64: (8, 'Q'),
+            SFixed64: (8, 'q'),
+            Double: (8, 'd'),
+        }.get(field_type)
+
+        if elem is not None:
+            self._elem_size, self._struct_fmt = elem
+        else:
+            self._elem_size = self._struct_fmt = None
+
+        # these types write values verbatim as varints, so a payload of
+        # all-single-byte values is just the raw byte values
+        self._plain_varint = field_type in (
+            Int32, Int64, UInt32, UInt64, EnumField,
+        )
 
     def encode(self, values: list) -> bytes:
         if not values:
             return b''
 
-        data = bytearray()
+        fmt = self._struct_fmt
 
-        for item in values:
-            data += self.field.encode_value(item)
+        if fmt is not None:
+            payload = struct.pack(f'<{len(values)}{fmt}', *values)
+            return b''.join([
+                self.header, encode_varint(len(payload)), payload
+            ])
 
-        return (
-            self.header +
-            encode_bytes(data)
-        )
+        if self._plain_varint and all(0 <= item < 128 for item in values):
+            # the common small-int case: every element is a one-byte
+            # varint, so the payload is built with a single C call
+            payload = bytes(values)
+            return b''.join([
+                self.header, encode_varint(len(payload)), payload
+            ])
 
-    def decode(self, stream: IO) -> list:
-        length = decode_varint(stream)
+        encode_value = self.field.encode_value
+        parts = [encode_value(item) for item in values]
+        length = sum(map(len, parts))
 
-        items = []
+        return b''.join([self.header, encode_varint(length), *parts])
 
-        data = stream.read(length)
+    def decode(self, data: bytes, position: int = 0) -> Tuple[list, int]:
+        length, position = decode_varint(data, position)
+        end = position + length
 
-        if len(data) < length:
+        if end > len(data):
             raise MessageDecodeError(
-                f'Expected to read {length:_} bytes, read {len(data):_} bytes instead'
+                f'Expected to read {length:_} bytes, read {len(data) - position:_} bytes instead'
             )
 
-        stream = io.BytesIO(data)
+        finalize = self._finalize
+
+        if finalize is not _DECODE_PER_ELEMENT:
+            items = decode_packed_varints(data, position, end)
+
+            if finalize is not None:
+                items = finalize(items)
 
-        while stream.seek(0, io.SEEK_CUR) < length:
-            items.append(self.field.decode(stream))
+            return items, end
 
-        return items
+        fmt = self._struct_fmt
+
+        if fmt is not None:
+            count, remainder = divmod(length, self._elem_size)
+
+            if remainder:
+                raise MessageDecodeError(
+                    f'Expected to read {self._elem_size} bytes, got {remainder} bytes instead'
+                )
+
+            items = list(struct.unpack_from(f'<{count}{fmt}', data, position))
+            return items, position + count * self._elem_size
+
+        items = []
+        append = items.append
+        decode_item = self.field.decode
+
+        while position < end:
+            item, position = decode_item(data, position)
+            append(item)
+
+        if position > end:
+            # the last element continued past the declared payload
+            # length, consuming bytes that belong to the next field
+            raise MessageDecodeError(
+                'Unexpected end of data when reading packed repeated field'
+            )
+
+        return items, position
 
 
 class UnpackedRepeatedStrategy(BaseRepeatedStrategy):
+    __slots__ = ('_packer',)
+
+    def __init__(self, field: Field, number: int):
+        super().__init__(field, number)
+        # fixed-width fields carry a Struct packer, which lets encode
+        # size its output buffer exactly instead of joining parts
+        self._packer = getattr(field, '_packer', None)
+
     @property
     def wire_type(self):
         return self.field.wire_type
@@ -184,14 +326,34 @@ class UnpackedRepeatedStrategy(BaseRepeatedStrategy):
         if not values:
             return b''
 
-        data = bytearray()
+        header = self.field.header
+        packer = self._packer
+
+        if packer is not None:
+            header_size = len(header)
+            item_size = header_size + packer.size
+            pack_into = packer.pack_into
+            out = bytearray(len(values) * item_size)
+            offset = 0
+
+            for item in values:
+                out[offset:offset + header_size] = header
+                pack_into(out, offset + header_size, item)
+                offset += item_size
+
+            return bytes(out)
+
+        parts = []
+        append = parts.append
+        encode_value = self.field.encode_value
 
         for item in values:
-            data += self.field.header + self.field.encode_value(item)
+            append(header)
+            append(encode_value(item))
 
-        return data
+        return b''.join(parts)
 
-    def decode(self, stream: IO):
+    def decode(self, data: bytes, position: int = 0):
         """
         From docs:
         "repeated values do not have to appear consecutively;
@@ -199,10 +361,12 @@ class UnpackedRepeatedStrategy(BaseRepeatedStrategy):
 
         That's why we can only read exactly one item at a time
         """
-        return self.field.decode(stream)
+        return self.field.decode(data, position)
 
 
 class Repeated(Field):
+    __slots__ = ('field', 'of_type', 'packed', 'strategy', 'wire_type')
+
     def __init__(
         self,
         of_type: Union[Type['Message'], Type[enum.IntEnum], Type[Field]],
@@ -229,12 +393,18 @@ class Repeated(Field):
 
         if packed:
             self.strategy = PackedRepeatedStrategy(self.field, number)
+            header = self.strategy.header
         else:
             self.strategy = UnpackedRepeatedStrategy(self.field, number)
+            header = self.field.header
 
         self.wire_type = self.strategy.wire_type
 
-        super().__init__(number=number)
+        # the number was validated and the matching header encoded when
+        # self.field was built, no point in doing either a second time
+        self.number = number
+        self.header = header
+        self.name = None
 
     def encode(self, values: list) -> bytes:
         return self.strategy.encode(values)
@@ -242,37 +412,56 @@ class Repeated(Field):
     def encode_value(self, values: list) -> bytes:
         return self.strategy.encode(values)
 
-    def decode(self, stream: IO) -> list:
-        return self.strategy.decode(stream)
+    def encode_into(self, out: bytearray, values: list):
+        # the strategy emits a header per item (or one packed header),
+        # the field's own header must not be prepended
+        out += self.strategy.encode(values)
+
+    def decode(self, data: bytes, position: int = 0):
+        return self.strategy.decode(data, position)
 
     def validate_value(self, values: Iterable):
-        if not isinstance(values, Iterable):
+        # a plain __iter__ probe; isinstance against the Iterable ABC
+        # walks the abc registry and this runs on every setattr
+        if not hasattr(values, '__iter__'):
             raise ValueError(
                 f'Repeated field {self.name!r} should be a \'list\' or \'tuple\', got {type(values).__name__!r} instead'
             )
 
+        validate_repeated = getattr(self.field, 'validate_repeated', None)
+
+        if validate_repeated is not None and type(values) in (list, tuple):
+            validate_repeated(values)
+            return
+
+        validate_item = self.field.validate_value
+
         for value in values:
-            self.field.validate_value(value)
+            validate_item(value)
 
 
 class Int(PrimitiveField):
+    __slots__ = ()
+
     min_value: int
     max_value: int
-    wire_type = WireType.VARINT
+    wire_type = _WT_VARINT
 
     def encode_value(self, value: int) -> bytes:
-        if value < 0:
-            value += 2 ** 64
-
-        return encode_varint(value)
-
-    def decode(self, stream: IO) -> int:
-        value = decode_varint(stream)
+        # masking wraps negatives into [2**63, 2**64) in a single
+        # branchless op; in-range non-negatives pass through unchanged
+        return encode_varint(value & 0xFFFF_FFFF_FFFF_FFFF)
 
-        if value > 2 ** 63 - 1:
-            value -= 2 ** 64
+    def encode_into(self, out: bytearray, value: int):
+        out += self.header
+        encode_varint_into(out, value & 0xFFFF_FFFF_FFFF_FFFF)
 
-        return value
+    def decode(self, data: bytes, position: int = 0) -> Tuple[int, int]:
+        value, position = decode_varint(data, position)
+        # branchless sign extension: flipping bit 63 and subtracting
+        # 2 ** 63 maps [2**63, 2**64) onto the negative range while
+        # leaving smaller values untouched
+        return (value ^ 0x8000_0000_0000_0000) - 0x8000_0000_0000_0000, position
 
     def validate_value(self, value: int):
         if not isinstance(value, int):
@@ -281,51 +470,91 @@ class Int(PrimitiveField):
                 f"got {type(value).__name__!r} instead"
             )
 
+        # one chained comparison decides the common in-range case;
+        # which bound was violated only matters when raising
+        if self.min_value <= value <= self.max_value:
+            return
+
         if value < self.min_value:
             raise ValueError(
                 f'Value {value!r} is less than min value {self.min_value!r} '
                 f'of type {type(self).__name__}'
             )
 
-        if value > self.max_value:
-            raise ValueError(
-                f'Value {value} is greater than max value {self.max_value} '
-                f'of type {type(self).__name__}'
-            )
+        raise ValueError(
+            f'Value {value} is greater than max value {self.max_value} '
+            f'of type {type(self).__name__}'
+        )
+
+    def validate_repeated(self, values: list):
+        """
+        Bounds-checks a whole list of ints at once.
+
+        min/max run their loops in C, which beats a Python-level
+        isinstance plus two comparisons per element by a wide margin
+        """
+        if not values:
+            return
+
+        if not all(type(value) is int for value in values):
+            # bools and IntEnum variants take the per-element path
+            for value in values:
+                self.validate_value(value)
+            return
+
+        if min(values) < self.min_value or max(values) > self.max_value:
+            # re-run the scalar validator to raise its usual error
+            # for the offending element
+            for value in values:
+                self.validate_value(value)
 
 
 class UInt(Int, ABC):
-    def decode(self, stream: IO) -> int:
-        return decode_varint(stream)
+    __slots__ = ()
+
+    def decode(self, data: bytes, position: int = 0) -> Tuple[int, int]:
+        return decode_varint(data, position)
 
 
 class SInt(Int, ABC):
-    def decode(self, stream: IO) -> int:
-        zig_zag_value = decode_varint(stream)
-        return decode_zig_zag(zig_zag_value)
+    __slots__ = ()
+
+    def decode(self, data: bytes, position: int = 0) -> Tuple[int, int]:
+        zig_zag_value, position = decode_varint(data, position)
+        return decode_zig_zag(zig_zag_value), position
 
 
 class Int32(Int):
+    __slots__ = ()
+
     min_value: int = MIN_INT32
     max_value: int = MAX_INT32
 
 
 class Int64(Int):
+    __slots__ = ()
+
     min_value: int = MIN_INT64
     max_value: int = MAX_INT64
 
 
 class UInt32(UInt):
+    __slots__ = ()
+
     min_value: int = MIN_UINT32
     max_value: int = MAX_UINT32
 
 
 class UInt64(UInt):
+    __slots__ = ()
+
     min_value: int = MIN_UINT64
     max_value: int = MAX_UINT64
 
 
 class SInt32(SInt):
+    __slots__ = ()
+
     min_value: int = MIN_INT32
     max_value: int = MAX_INT32
 
@@ -333,8 +562,14 @@ class SInt32(SInt):
         zig_zag_value = encode_zig_zag32(value)
         return encode_varint(zig_zag_value)
 
+    def encode_into(self, out: bytearray, value: int):
+        out += self.header
+        encode_varint_into(out, encode_zig_zag32(value))
+
 
 class SInt64(SInt):
+    __slots__ = ()
+
     min_value: int = MIN_INT64
     max_value: int = MAX_INT64
 
@@ -342,15 +577,29 @@ class SInt64(SInt):
         zig_zag_value = encode_zig_zag64(value)
         return encode_varint(zig_zag_value)
 
+    def encode_into(self, out: bytearray, value: int):
+        out += self.header
+        encode_varint_into(out, encode_zig_zag64(value))
+
 
 class Bytes(PrimitiveField):
-    wire_type = WireType.LENGTH
+    __slots__ = ()
+
+    wire_type = _WT_LENGTH
 
     def encode_value(self, value: bytes) -> bytes:
         return encode_bytes(value)
 
-    def decode(self, stream: IO) -> bytes:
-        return decode_bytes(stream)
+    def encode_into(self, out: bytearray, value: bytes):
+        out += self.header
+        encode_varint_into(out, len(value))
+        out += value
+
+    def decode(self, data: bytes, position: int = 0) -> Tuple[bytes, int]:
+        value, position = decode_bytes(data, position)
+        # decode_bytes hands out a zero-copy view when parsing
+        # a nested message; field values are always plain bytes
+        return bytes(value), position
 
     def validate_value(self, value: bytes):
         if not isinstance(value, bytes):
@@ -361,15 +610,25 @@ class Bytes(PrimitiveField):
 
 
 class String(PrimitiveField):
-    wire_type = WireType.LENGTH
+    __slots__ = ()
+
+    wire_type = _WT_LENGTH
 
     def encode_value(self, value: str) -> bytes:
         data = value.encode('utf-8')
         return encode_bytes(data)
 
-    def decode(self, stream: IO) -> str:
-        data = decode_bytes(stream)
-        return data.decode('utf-8')
+    def encode_into(self, out: bytearray, value: str):
+        data = value.encode('utf-8')
+        out += self.header
+        encode_varint_into(out, len(data))
+        out += data
+
+    def decode(self, data: bytes, position: int = 0) -> Tuple[str, int]:
+        # utf-8 decoding reads straight from the view, so the payload
+        # is never materialized as an intermediate bytes object
+        value, position = decode_bytes_view(data, position)
+        return str(value, 'utf-8'), position
 
     def validate_value(self, value: str):
         if not isinstance(value, str):
@@ -380,17 +639,20 @@ class String(PrimitiveField):
 
 
 class Bool(PrimitiveField):
-    wire_type = WireType.VARINT
+    __slots__ = ()
+
+    wire_type = _WT_VARINT
 
     def encode_value(self, value: bool) -> bytes:
-        return chr(value).encode()
+        return b'\x01' if value else b'\x00'
 
-    def decode(self, stream: IO) -> bool:
-        value = decode_varint(stream)
-        return bool(value)
+    def decode(self, data: bytes, position: int = 0) -> Tuple[bool, int]:
+        value, position = decode_varint(data, position)
+        return value != 0, position
 
     def validate_value(self, value: bool):
-        if not isinstance(value, bool):
+        # identity check beats isinstance since bool has exactly two instances
+        if value is not True and value is not False:
             raise ValueError(
                 f"Expected a value of type 'bool', "
                 f"got {type(value).__name__!r} instead"
@@ -411,7 +673,9 @@ def _validate_py_enum(py_enum: Type[enum.IntEnum]):
 
 
 class EnumField(PrimitiveField):
-    wire_type = WireType.VARINT
+    __slots__ = ('py_enum', '_variant_by_value')
+
+    wire_type = _WT_VARINT
 
     def __init__(
         self,
@@ -430,23 +694,30 @@ class EnumField(PrimitiveField):
         )
 
         self.py_enum: Type[enum.IntEnum] = py_enum
+        # IntEnum's __call__ dispatches through EnumMeta which is
+        # far more expensive than a dict lookup on the decode path
+        self._variant_by_value: Dict[int, enum.IntEnum] = {
+            variant.value: variant
+            for variant in py_enum
+        }
 
     def encode_value(self, value: int) -> bytes:
         return encode_varint(value)
 
-    def decode(self, stream: IO) -> Optional[int]:
-        value = decode_varint(stream)
+    def decode(self, data: bytes, position: int = 0) -> Tuple[Optional[int], int]:
+        value, position = decode_varint(data, position)
 
         # Specification: omit value that's not in the enum's variants
-        try:
-            return self.py_enum(value)
-        except ValueError:
-            return None
+        return self._variant_by_value.get(value), position
 
     def validate_value(self, value: int):
         try:
-            self.py_enum(value)
-        except ValueError:
+            valid = value in self._variant_by_value
+        except TypeError:
+            # unhashable values can't possibly be enum variants
+            valid = False
+
+        if not valid:
             raise ValueError(
                 f'Expected an enum value of {repr([x for x in self.py_enum])}, '
                 f'got {value} instead'
@@ -454,97 +725,122 @@ class EnumField(PrimitiveField):
 
 
 class Fixed32(Int):
+    __slots__ = ()
+
     min_value = MIN_UINT32
     max_value = MAX_UINT32
-    wire_type = WireType.FIXED_32
+    wire_type = _WT_FIXED_32
+    _packer = struct.Struct('<I')
 
     def encode_value(self, value: int) -> bytes:
-        return struct.pack('<I', value)
+        return self._packer.pack(value)
 
-    def decode(self, stream: IO) -> int:
-        data = stream.read(4)
+    def encode_into(self, out: bytearray, value: int):
+        out += self.header
+        out += self._packer.pack(value)
 
-        if len(data) != 4:
+    def decode(self, data: bytes, position: int = 0) -> Tuple[int, int]:
+        if position + 4 > len(data):
             raise MessageDecodeError(
-                f"Expected to read 4 bytes, got {len(data)} bytes instead"
+                f"Expected to read 4 bytes, got {len(data) - position} bytes instead"
             )
 
-        return struct.unpack('<I', data)[0]
+        return self._packer.unpack_from(data, position)[0], position + 4
 
 
 class Fixed64(Int):
+    __slots__ = ()
+
     min_value = MIN_UINT64
     max_value = MAX_UINT64
-    wire_type = WireType.FIXED_64
+    wire_type = _WT_FIXED_64
+    _packer = struct.Struct('<Q')
 
     def encode_value(self, value: int) -> bytes:
-        return struct.pack('<Q', value)
+        return self._packer.pack(value)
 
-    def decode(self, stream: IO) -> int:
-        data = stream.read(8)
+    def encode_into(self, out: bytearray, value: int):
+        out += self.header
+        out += self._packer.pack(value)
 
-        if len(data) != 8:
+    def decode(self, data: bytes, position: int = 0) -> Tuple[int, int]:
+        if position + 8 > len(data):
             raise MessageDecodeError(
-                f"Expected to read 8 bytes, got {len(data)} bytes instead"
+                f"Expected to read 8 bytes, got {len(data) - position} bytes instead"
             )
 
-        return struct.unpack('<Q', data)[0]
+        return self._packer.unpack_from(data, position)[0], position + 8
 
 
 class SFixed32(Int):
+    __slots__ = ()
+
     min_value = MIN_INT32
     max_value = MAX_INT32
-    wire_type = WireType.FIXED_32
+    wire_type = _WT_FIXED_32
+    _packer = struct.Struct('<i')
 
     def encode_value(self, value: int) -> bytes:
-        return struct.pack('<i', value)
+        return self._packer.pack(value)
 
-    def decode(self, stream: IO) -> int:
-        data = stream.read(4)
+    def encode_into(self, out: bytearray, value: int):
+        out += self.header
+        out += self._packer.pack(value)
 
-        if len(data) < 4:
+    def decode(self, data: bytes, position: int = 0) -> Tuple[int, int]:
+        if position + 4 > len(data):
             raise MessageDecodeError(
-                f"Expected to read 4 bytes, got {len(data)} bytes instead"
+                f"Expected to read 4 bytes, got {len(data) - position} bytes instead"
             )
 
-        return struct.unpack('<i', data)[0]
+        return self._packer.unpack_from(data, position)[0], position + 4
 
 
 class SFixed64(Int):
+    __slots__ = ()
+
     min_value = MIN_INT64
     max_value = MAX_INT64
-    wire_type = WireType.FIXED_64
+    wire_type = _WT_FIXED_64
+    _packer = struct.Struct('<q')
 
     def encode_value(self, value: int) -> bytes:
-        return struct.pack('<q', value)
+        return self._packer.pack(value)
 
-    def decode(self, stream: IO) -> int:
-        data = stream.read(8)
+    def encode_into(self, out: bytearray, value: int):
+        out += self.header
+        out += self._packer.pack(value)
 
-        if len(data) < 8:
+    def decode(self, data: bytes, position: int = 0) -> Tuple[int, int]:
+        if position + 8 > len(data):
             raise MessageDecodeError(
-                f"Expected to read 8 bytes, got {len(data)} bytes instead"
+                f"Expected to read 8 bytes, got {len(data) - position} bytes instead"
             )
 
-        return struct.unpack('<q', data)[0]
+        return self._packer.unpack_from(data, position)[0], position + 8
 
 
 class Float(PrimitiveField):
+    __slots__ = ()
+
     max_value = MAX_FLOAT
-    wire_type = WireType.FIXED_32
+    wire_type = _WT_FIXED_32
+    _packer = struct.Struct('<f')
 
     def encode_value(self, value) -> bytes:
-        return struct.pack('<f', value)
+        return self._packer.pack(value)
 
-    def decode(self, stream: IO):
-        data = stream.read(4)
+    def encode_into(self, out: bytearray, value):
+        out += self.header
+        out += self._packer.pack(value)
 
-        if len(data) < 4:
+    def decode(self, data: bytes, position: int = 0) -> Tuple[float, int]:
+        if position + 4 > len(data):
             raise MessageDecodeError(
-                f'Expected to read 4 bytes, got {len(data)} bytes instead'
+                f'Expected to read 4 bytes, got {len(data) - position} bytes instead'
             )
 
-        return struct.unpack('<f', data)[0]
+        return self._packer.unpack_from(data, position)[0], position + 4
 
     def validate_value(self, value):
         if not (
@@ -570,25 +866,32 @@ class Float(PrimitiveField):
 
 
 class Double(Float):
+    __slots__ = ()
+
     max_value = MAX_DOUBLE
-    wire_type = WireType.FIXED_64
+    wire_type = _WT_FIXED_64
+    _packer = struct.Struct('<d')
 
     def encode_value(self, value) -> bytes:
-        return struct.pack('<d', value)
+        return self._packer.pack(value)
 
-    def decode(self, stream: IO):
-        data = stream.read(8)
+    def encode_into(self, out: bytearray, value):
+        out += self.header
+        out += self._packer.pack(value)
 
-        if len(data) < 8:
+    def decode(self, data: bytes, position: int = 0) -> Tuple[float, int]:
+        if position + 8 > len(data):
             raise MessageDecodeError(
-                f'Expected to read 8 bytes, got {len(data)} bytes instead'
+                f'Expected to read 8 bytes, got {len(data) - position} bytes instead'
             )
 
-        return struct.unpack('<d', data)[0]
+        return self._packer.unpack_from(data, position)[0], position + 8
 
 
 class MapField(Field):
-    wire_type = WireType.LENGTH
+    __slots__ = ('dict_entry', 'key_field', 'value_field')
+
+    wire_type = _WT_LENGTH
     valid_key_fields = {
         Int32,
         Int64,
@@ -637,26 +940,41 @@ class MapField(Field):
         self.key_field = key_field
         self.value_field = value_field
 
+    def encode_into(self, out: bytearray, value: Dict):
+        # one header per entry is emitted here
+        header = self.header
+        validate_key = self.key_field.validate_value
+        validate_item = self.value_field.validate_value
+        encode_key = self.key_field.encode_into
+        encode_item = self.value_field.encode_into
+        entry = bytearray()
+
+        # entries are encoded straight from the key/value fields;
+        # building a _DictEntry message per pair would re-run the
+        # whole message machinery for a fixed two-field schema
+        for key, item in value.items():
+            validate_key(key)
+            validate_item(item)
+
+            entry.clear()
+            encode_key(entry, key)
+            encode_item(entry, item)
+
+            out += header
+            encode_varint_into(out, len(entry))
+            out += entry
+
     def encode_value(self, value: Dict) -> bytes:
         buffer = bytearray()
-
-        for key, value in value.items():
-            buffer += self.header + encode_bytes(
-                self.dict_entry(
-                    key=key,
-                    value=value
-                ).to_bytes()
-            )
-
+        self.encode_into(buffer, value)
         return bytes(buffer)
 
     encode = encode_value
 
-    def decode(self, stream: BinaryIO) -> Tuple:
-        entry = self.dict_entry.from_bytes(
-            decode_bytes(stream)
-        )
-        return entry.key, entry.value
+    def decode(self, data: bytes, position: int = 0) -> Tuple[Tuple, int]:
+        entry_data, position = decode_bytes(data, position)
+        entry = self.dict_entry.from_bytes(entry_data)
+        return (entry.key, entry.value), position
 
     def validate_value(self, value: Dict):
         if not isinstance(value, dict):
@@ -666,7 +984,9 @@ class MapField(Field):
 
 
 class MessageField(Field):
-    wire_type = WireType.LENGTH
+    __slots__ = ('of_type', 'required')
+
+    wire_type = _WT_LENGTH
 
     def __init__(
         self,
@@ -683,10 +1003,19 @@ class MessageField(Field):
         encoded_message = value.to_bytes()
         return encode_bytes(encoded_message)
 
-    def decode(self, stream: IO, *, strict=True):
-        length = decode_varint(stream)
-        message_stream = io.BytesIO(stream.read(length))
-        return self.of_type.from_stream(message_stream, strict=strict)
+    def encode_into(self, out: bytearray, value):
+        encoded_message = value.to_bytes()
+        out += self.header
+        encode_varint_into(out, len(encoded_message))
+        out += encoded_message
+
+    def decode(self, data: bytes, position: int = 0, *, strict=True):
+        length, position = decode_varint(data, position)
+        end = position + length
+        # a memoryview makes the sub-message parse a view
+        # of the original buffer instead of copying it
+        message = self.of_type.from_bytes(memoryview(data)[position:end], strict=strict)
+        return message, end
 
     def validate_value(self, value):
         if not isinstance(value, self.of_type):
@@ -697,6 +1026,8 @@ class MessageField(Field):
 
 
 class OneOf:
+    __slots__ = ('fields', 'name')
+
     def __init__(self, *args: str):
         self.fields: List[str] = list(args)
 
@@ -1,9 +1,8 @@
-import io
 from abc import ABCMeta
 from enum import IntEnum
 from typing import BinaryIO, List, Callable, Optional, TypeVar, Type, Dict, Union, Set
 
-from protox.encoding import decode_header, wire_type_to_decoder
+from protox.encoding import decode_varint, wire_type_to_decoder
 from protox.exceptions import MessageEncodeError, MessageDecodeError, FieldValidationError
 from protox.fields import Field, OneOf, Repeated, MessageField, MapField, PrimitiveField
 from protox.validated_dict import ValidatedDict
@@ -147,11 +146,114 @@ def _add_field_to_message(
     )
 
 
+# how a decoded value is stored into the message, precomputed per field
+# so the decode loop compares ints instead of calling isinstance
+_DECODE_SCALAR = 0
+_DECODE_REPEATED = 1
+_DECODE_MAP = 2
+_DECODE_MESSAGE = 3
+
+
+def _build_decode_table(message_type: Type['Message']):
+    """
+    Builds the tag -> (name, decode, kind) table that drives
+    Message.from_bytes.
+
+    Keying by the full wire tag (number << 3 | wire_type) folds the
+    per-field wire type comparison into the dict lookup itself: a tag
+    with the right number but the wrong wire type simply misses
+    """
+    table = {}
+
+    for number, field in message_type._field_by_number.items():
+        if isinstance(field, Repeated) and not field.packed:
+            kind = _DECODE_REPEATED
+        elif isinstance(field, MapField):
+            kind = _DECODE_MAP
+        elif isinstance(field, MessageField):
+            kind = _DECODE_MESSAGE
+        else:
+            kind = _DECODE_SCALAR
+
+        table[number << 3 | field.wire_type] = (field.name, field.decode, kind)
+
+    message_type._decode_table = table
+
+    # the strict-mode presence check walks this tuple instead of
+    # re-inspecting every field's required/default attributes per decode
+    message_type._decode_required = tuple(
+        name
+        for name, field in message_type._field_by_name.items()
+        if getattr(field, 'required', False) and not getattr(field, 'default', None)
+    )
+
+
+def _compile_to_bytes(message_type: Type['Message']):
+    """
+    Generates a to_bytes specialized for the message's fields.
+
+    The generic implementation walks the field dict and re-checks
+    each field's kind on every call. The schema is fixed once the class
+    is built, so that work is flattened here into straight-line code
+    with the field encoders bound as locals of the generated module
+    """
+    lines = [
+        'def to_bytes(self) -> bytes:',
+        '    if self._required_fields and not self.is_initialized():',
+        '        required_fields = self._required_fields - self._data.keys()',
+        '',
+        '        raise MessageEncodeError(',
+        "        f'Message {type(self).__qualname__!r} is missing required fields: {\", \".join(required_fields)}'",
+        '        )',
+        '',
+        '    data = self._data',
+        '    buffer = bytearray()',
+    ]
+
+    namespace = {'MessageEncodeError': MessageEncodeError}
+
+    for name, field in message_type._field_by_name.items():
+        encoder = f'_encode_{name}'
+        namespace[encoder] = field.encode_into
+
+        default = getattr(field, 'default', None)
+
+        if default is None:
+            lines.append(f'    value = data.get({name!r})')
+        else:
+            default_name = f'_default_{name}'
+            namespace[default_name] = default
+            lines.append(f'    value = data.get({name!r}, {default_name})')
+
+        lines.append('    if value is not None:')
+        lines.append(f'        {encoder}(buffer, value)')
+        lines.append('')
+
+    lines.append('    return bytes(buffer)')
+
+    code = compile(
+        '\n'.join(lines),
+        f'<protox:{message_type.__name__}.to_bytes>',
+        'exec',
+    )
+    exec(code, namespace)
+
+    message_type.to_bytes = namespace['to_bytes']
+
+
 def define_fields(
     # using this mangled name to avoid field name conflict
     __message_type__: Type['Message'],
     **kwargs,
 ):
+    if not kwargs and '_decode_table' in __message_type__.__dict__:
+        # nothing new to register and this exact class already built
+        # its tables; late registrations (e.g. for circular references)
+        # only pay the rebuild when they actually add fields. Checking
+        # the class dict matters: a subclass inherits the parent's
+        # table attribute but must still build its own empty tables
+        return
+
     for name, field in kwargs.items():
         _add_field_to_message(
             __message_type__,
@@ -159,6 +261,9 @@ def define_fields(
             field,
         )
 
+    _build_decode_table(__message_type__)
+    _compile_to_bytes(__message_type__)
+
 
 class MessageMeta(ABCMeta):
     def __new__(mcs, name, bases, namespace):
@@ -235,11 +340,17 @@ T = TypeVar('T')
 
 
 class Message(metaclass=MessageMeta):
+    # field values are stored in _data, so subclasses that declare
+    # __slots__ = () get instances without a per-instance __dict__
+    __slots__ = ('_data', '_which_one_of')
+
     # The following fields provided by metaclass
     _field_by_name: Dict[str, Union[Field, Repeated]] = None
     _field_by_number: Dict[int, Union[Field, Repeated]] = None
     _one_of_by_field_name: dict = None
     _required_fields: Set[str] = None
+    _decode_table: Dict[int, tuple] = None
+    _decode_required: tuple = None
 
     # Provided by code generator
     DESCRIPTOR: 'DescriptorProto' = None
@@ -305,65 +416,74 @@ class Message(metaclass=MessageMeta):
 
     @classmethod
     def from_bytes(cls: Type[T], data: bytes, *, strict=True) -> T:
-        stream = io.BytesIO(data)
-        return cls.from_stream(stream, strict=strict)
-
-    @classmethod
-    def from_stream(cls: Type[T], stream: BinaryIO, *, strict=True) -> T:
         """
-        :param stream:
+        :param data: the wire-format encoding of the message
         :param strict: when strict is False MessageDecodeError won't be raised in case a required field was not read
         :return: Message of type T
         """
         message_fields = {}
+        decode_table = cls._decode_table
+
+        position = 0
+        end = len(data)
 
-        while True:
-            # checking for end of message
-            try:
-                number, wire_type = decode_header(stream)
-            except MessageDecodeError:
-                break
+        while position < end:
+            tag, position = decode_varint(data, position)
 
-            if number in cls._field_by_number:
-                field = cls._field_by_number[number]
+            entry = decode_table.get(tag)
 
-                if field.wire_type != wire_type:
+            if entry is not None:
+                name, decode, kind = entry
+
+                if kind == _DECODE_SCALAR:
+                    message_fields[name], position = decode(data, position)
+                elif kind == _DECODE_REPEATED:
+                    value, position = decode(data, position)
+                    message_fields.setdefault(name, []).append(value)
+                elif kind == _DECODE_MESSAGE:
+                    message_fields[name], position = decode(data, position, strict=strict)
+                else:
+                    (key, value), position = decode(data, position)
+                    message_fields.setdefault(name, {})[key] = value
+            else:
+                wire_type = tag & 0b111
+                field = cls._field_by_number.get(tag >> 3)
+
+                if field is not None:
                     raise MessageDecodeError(
                         f"Field {field.name} has wire_type={field.wire_type}, "
                         f"read wire_type={wire_type} instead"
                     )
 
-                if isinstance(field, Repeated) and not field.packed:
-                    message_fields.setdefault(field.name, []).append(field.decode(stream))
-                elif isinstance(field, MapField):
-                    key, value = field.decode(stream)
-                    message_fields.setdefault(field.name, {})[key] = value
-                elif isinstance(field, MessageField):
-                    message_fields[field.name] = field.decode(stream, strict=strict)
-                else:
-                    message_fields[field.name] = field.decode(stream)
-            else:
+                if wire_type > 5:
+                    raise MessageDecodeError(
+                        f'Read invalid wire_type={wire_type}'
+                    )
+
                 # read and discard unknown field
-                wire_type_to_decoder[wire_type](stream)
+                _, position = wire_type_to_decoder[wire_type](data, position)
 
         if strict:
-            # TODO: when adding field to Message if the field is required
-            #  put it to Message._required_fields to simplify the following check
-            for key, field, in cls._field_by_name.items():
-                if getattr(field, 'required', False) and not getattr(field, 'default', None) and key not in message_fields:
+            for key in cls._decode_required:
+                if key not in message_fields:
                     raise MessageDecodeError(
                         f"Missing required field {key}"
                     )
 
         return cls(**message_fields)
 
-    def to_bytes(self) -> bytes:
-        stream = io.BytesIO()
-        self.to_stream(stream)
-        stream.seek(0)
-        return stream.read()
+    @classmethod
+    def from_stream(cls: Type[T], stream: BinaryIO, *, strict=True) -> T:
+        """
+        :param stream:
+        :param strict: when strict is False MessageDecodeError won't be raised in case a required field was not read
+        :return: Message of type T
+        """
+        return cls.from_bytes(stream.read(), strict=strict)
 
-    def to_stream(self, stream: BinaryIO):
+    def to_bytes(self) -> bytes:
+        # concrete subclasses get a generated implementation
+        # of this method, see _compile_to_bytes
         if not self.is_initialized():
             required_fields = self._required_fields - self._data.keys()
 
@@ -371,13 +491,20 @@ class Message(metaclass=MessageMeta):
                 f'Message {type(self).__qualname__!r} is missing required fields: {", ".join(required_fields)}'
             )
 
+        buffer = bytearray()
+
         for key, field in self._field_by_name.items():
             value = getattr(self, key)
 
             if value is None and not getattr(field, 'required', False):
                 continue
 
-            stream.write(field.encode(value))
+            buffer += field.encode(value)
+
+        return bytes(buffer)
+
+    def to_stream(self, stream: BinaryIO):
+        stream.write(self.to_bytes())
 
     def has_field(self, name: str) -> bool:
         """
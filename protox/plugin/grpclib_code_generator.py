@@ -182,21 +182,30 @@ class GrpclibCodeGenerator:
 
                     buffer.nl()
 
+                w('_mapping_cache = None')
+                buffer.nl()
+
                 w('def __mapping__(self) -> typing.Dict[str, grpclib.const.Handler]:')
 
                 with buffer.indent():
-                    w('return {')
+                    w('if self._mapping_cache is None:')
 
                     with buffer.indent():
-                        for method in service.method:
-                            self.write_server_method(
-                                service,
-                                method,
-                                buffer,
-                                import_requests,
-                            )
-
-                    w('}')
+                        w('self._mapping_cache = {')
+
+                        with buffer.indent():
+                            for method in service.method:
+                                self.write_server_method(
+                                    service,
+                                    method,
+                                    buffer,
+                                    import_requests,
+                                )
+
+                        w('}')
+
+                    buffer.nl()
+                    w('return self._mapping_cache')
             else:
                 w('def __mapping__(self) -> typing.Dict[str, grpclib.const.Handler]:')
                 with buffer.indent():
@@ -209,11 +209,16 @@ class ProtobufCodeGenerator:
 
         if is_empty_message(message):
             with indent():
-                w('pass')
+                w('__slots__ = ()')
             return
 
         # body
         with indent():
+            # field values live in Message._data, so an empty __slots__
+            # keeps instances free of a per-instance __dict__
+            w('__slots__ = ()')
+            nl()
+
             # enums
             for enum_type in message.enum_type:
                 self.write_enum(enum_type)
@@ -245,6 +250,7 @@ class ProtobufCodeGenerator:
 
     def write_init(self, message: DescriptorProto):
         w = self._buffer.write
+        nl = self._buffer.nl
         indent = self._buffer.indent
 
         w('def __init__(')
@@ -263,14 +269,19 @@ class ProtobufCodeGenerator:
         w('):')
 
         with indent():
-            w('super().__init__(')
+            # assigning through the field properties directly keeps
+            # validation but skips the generic kwargs dict handling
+            # of protox.Message.__init__
+            w('self._data = {}')
+            w('self._which_one_of = {}')
+            nl()
 
-            with indent():
-                for field in message.field:
-                    field_name = self.resolve_field_name(message, field.name)
-                    w(f'{field_name}={field_name},')
+            for field in message.field:
+                field_name = self.resolve_field_name(message, field.name)
+                w(f'if {field_name} is not None:')
 
-            w(')')
+                with indent():
+                    w(f'self.{field_name} = {field_name}')
 
     def write_oneofs(self, message: DescriptorProto):
         w = self._buffer.write
@@ -1,10 +1,9 @@
 from collections import UserDict
 from enum import IntEnum
-from typing import Dict, List, Iterable, Union, Iterator, BinaryIO
+from typing import Dict, List, Iterable, Union, Iterator
 
 from protox import Message, fields, one_of, define_fields
 from protox.encoding import decode_header
-from protox.exceptions import MessageDecodeError
 
 PyValue_T = Union[
     type(None),
@@ -81,18 +80,17 @@ class Struct(Message, UserDict):
         return Struct(**value)
 
     @classmethod
-    def from_stream(cls, stream: BinaryIO, *, strict=True) -> 'Struct':
+    def from_bytes(cls, data: bytes, *, strict=True) -> 'Struct':
         rv = cls()
         map_field = cls._field_by_number[1]
 
-        while True:
-            # checking for end of message
-            try:
-                decode_header(stream)
-            except MessageDecodeError:
-                break
+        position = 0
+        end = len(data)
 
-            key, value = map_field.decode(stream)
+        while position < end:
+            _, _, position = decode_header(data, position)
+
+            (key, value), position = map_field.decode(data, position)
             rv.set_value(key, value)
 
         return rv
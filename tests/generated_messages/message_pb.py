@@ -6,9 +6,13 @@ import protox
 
 
 class TopLevel(protox.Message):
+    __slots__ = ()
+
     class SecondLevel(protox.Message):
+        __slots__ = ()
+
         class ThirdLevel(protox.Message):
-            pass
+            __slots__ = ()
 
         third: 'TopLevel.SecondLevel.ThirdLevel'
 
@@ -18,9 +22,11 @@ class TopLevel(protox.Message):
             *,
             third: 'TopLevel.SecondLevel.ThirdLevel' = None,
         ):
-            super().__init__(
-                third=third,
-            )
+            self._data = {}
+            self._which_one_of = {}
+
+            if third is not None:
+                self.third = third
 
     second: 'TopLevel.SecondLevel'
     third: 'TopLevel.SecondLevel.ThirdLevel'
@@ -31,15 +37,20 @@ class TopLevel(protox.Message):
         second: 'TopLevel.SecondLevel' = None,
         third: 'TopLevel.SecondLevel.ThirdLevel' = None,
     ):
-        super().__init__(
-            second=second,
-            third=third,
-        )
+        self._data = {}
+        self._which_one_of = {}
+
+        if second is not None:
+            self.second = second
+        if third is not None:
+            self.third = third
 
 
 class RepeatedMessage(protox.Message):
+    __slots__ = ()
+
     class User(protox.Message):
-        pass
+        __slots__ = ()
 
     users: typing.List['RepeatedMessage.User']
 
@@ -48,12 +59,16 @@ class RepeatedMessage(protox.Message):
         *,
         users: typing.List['RepeatedMessage.User'] = None,
     ):
-        super().__init__(
-            users=users,
-        )
+        self._data = {}
+        self._which_one_of = {}
+
+        if users is not None:
+            self.users = users
 
 
 class OneOfMessage(protox.Message):
+    __slots__ = ()
+
     x: typing.Optional[str]
     empty: typing.Optional[protox.Empty]
 
@@ -68,10 +83,13 @@ class OneOfMessage(protox.Message):
         x: typing.Optional[str] = None,
         empty: typing.Optional[protox.Empty] = None,
     ):
-        super().__init__(
-            x=x,
-            empty=empty,
-        )
+        self._data = {}
+        self._which_one_of = {}
+
+        if x is not None:
+            self.x = x
+        if empty is not None:
+            self.empty = empty
 
 
 FILE_DESCRIPTOR = protox.FileDescriptorProto.from_bytes(b'\n\rmessage.proto\x12\x0enested.message\x1a\x1bgoogle/protobuf/empty.proto"\xf3\x01\n\x08TopLevel\x12<\n\x06second\x18\x01 \x02(\x0b2$.nested.message.TopLevel.SecondLevelR\x06second\x12E\n\x05third\x18\x02 \x02(\x0b2/.nested.message.TopLevel.SecondLevel.ThirdLevelR\x05third\x1ab\n\x0bSecondLevel\x12E\n\x05third\x18\x01 \x02(\x0b2/.nested.message.TopLevel.SecondLevel.ThirdLevelR\x05third\x1a\x0c\n\nThirdLevel"U\n\x0fRepeatedMessage\x12:\n\x05users\x18\x01 \x03(\x0b2$.nested.message.RepeatedMessage.UserR\x05users\x1a\x06\n\x04User"X\n\x0cOneOfMessage\x12\x0e\n\x01x\x18\x01 \x01(\tH\x00R\x01x\x12.\n\x05empty\x18\x02 \x01(\x0b2\x16.google.protobuf.EmptyH\x00R\x05emptyB\x08\n\x06statusJ\xef\x04\n\x06\x12\x04\x00\x00\x1e\x01\n\x08\n\x01\x0c\x12\x03\x00\x00\x12\n\t\n\x02\x03\x00\x12\x03\x02\x07$\n\x08\n\x01\x02\x12\x03\x04\x08\x16\n\n\n\x02\x04\x00\x12\x04\x06\x00\x10\x01\n\n\n\x03\x04\x00\x01\x12\x03\x06\x08\x10\n\x0c\n\x04\x04\x00\x03\x00\x12\x04\x07\x04\x0c\x05\n\x0c\n\x05\x04\x00\x03\x00\x01\x12\x03\x07\x0c\x17\n\x0e\n\x06\x04\x00\x03\x00\x03\x00\x12\x04\x08\x08\t\t\n\x0e\n\x07\x04\x00\x03\x00\x03\x00\x01\x12\x03\x08\x10\x1a\n\r\n\x06\x04\x00\x03\x00\x02\x00\x12\x03\x0b\x08&\n\x0e\n\x07\x04\x00\x03\x00\x02\x00\x04\x12\x03\x0b\x08\x10\n\x0e\n\x07\x04\x00\x03\x00\x02\x00\x06\x12\x03\x0b\x11\x1b\n\x0e\n\x07\x04\x00\x03\x00\x02\x00\x01\x12\x03\x0b\x1c!\n\x0e\n\x07\x04\x00\x03\x00\x02\x00\x03\x12\x03\x0b$%\n\x0b\n\x04\x04\x00\x02\x00\x12\x03\x0e\x04$\n\x0c\n\x05\x04\x00\x02\x00\x04\x12\x03\x0e\x04\x0c\n\x0c\n\x05\x04\x00\x02\x00\x06\x12\x03\x0e\r\x18\n\x0c\n\x05\x04\x00\x02\x00\x01\x12\x03\x0e\x19\x1f\n\x0c\n\x05\x04\x00\x02\x00\x03\x12\x03\x0e"#\n\x0b\n\x04\x04\x00\x02\x01\x12\x03\x0f\x04.\n\x0c\n\x05\x04\x00\x02\x01\x04\x12\x03\x0f\x04\x0c\n\x0c\n\x05\x04\x00\x02\x01\x06\x12\x03\x0f\r#\n\x0c\n\x05\x04\x00\x02\x01\x01\x12\x03\x0f$)\n\x0c\n\x05\x04\x00\x02\x01\x03\x12\x03\x0f,-\n\n\n\x02\x04\x01\x12\x04\x12\x00\x17\x01\n\n\n\x03\x04\x01\x01\x12\x03\x12\x08\x17\n\x0c\n\x04\x04\x01\x03\x00\x12\x04\x13\x04\x14\x05\n\x0c\n\x05\x04\x01\x03\x00\x01\x12\x03\x13\x0c\x10\n\x0b\n\x04\x04\x01\x02\x00\x12\x03\x16\x04\x1c\n\x0c\n\x05\x04\x01\x02\x00\x04\x12\x03\x16\x04\x0c\n\x0c\n\x05\x04\x01\x02\x00\x06\x12\x03\x16\r\x11\n\x0c\n\x05\x04\x01\x02\x00\x01\x12\x03\x16\x12\x17\n\x0c\n\x05\x04\x01\x02\x00\x03\x12\x03\x16\x1a\x1b\n\n\n\x02\x04\x02\x12\x04\x19\x00\x1e\x01\n\n\n\x03\x04\x02\x01\x12\x03\x19\x08\x14\n\x0c\n\x04\x04\x02\x08\x00\x12\x04\x1a\x04\x1d\x05\n\x0c\n\x05\x04\x02\x08\x00\x01\x12\x03\x1a\n\x10\n\x0b\n\x04\x04\x02\x02\x00\x12\x03\x1b\x08\x15\n\x0c\n\x05\x04\x02\x02\x00\x05\x12\x03\x1b\x08\x0e\n\x0c\n\x05\x04\x02\x02\x00\x01\x12\x03\x1b\x0f\x10\n\x0c\n\x05\x04\x02\x02\x00\x03\x12\x03\x1b\x13\x14\n\x0b\n\x04\x04\x02\x02\x01\x12\x03\x1c\x08(\n\x0c\n\x05\x04\x02\x02\x01\x06\x12\x03\x1c\x08\x1d\n\x0c\n\x05\x04\x02\x02\x01\x01\x12\x03\x1c\x1e#\n\x0c\n\x05\x04\x02\x02\x01\x03\x12\x03\x1c&\'')
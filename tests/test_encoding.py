@@ -1,5 +1,3 @@
-import io
-
 import pytest
 
 from protox.encoding import (
@@ -19,10 +17,10 @@ from protox.exceptions import MessageDecodeError
 ])
 def test_encode_decode_varint(value):
     encoded_value = encode_varint(value)
-    stream = io.BytesIO(encoded_value)
-    decoded_value = decode_varint(stream)
+    decoded_value, position = decode_varint(encoded_value)
 
     assert decoded_value == value
+    assert position == len(encoded_value)
 
 
 @pytest.mark.parametrize('bad_input', [
@@ -32,18 +30,16 @@ def test_encode_decode_varint(value):
 ])
 def test_decode_varint_raises_on_eof(bad_input):
     encoded_value = bytes(bad_input)
-    stream = io.BytesIO(encoded_value)
 
     with pytest.raises(MessageDecodeError):
-        decode_varint(stream)
+        decode_varint(encoded_value)
 
 
 def test_decode_varint_raises_when_max_data_length_exceeded():
     bad_value = bytes([255] * 10 + [1])
-    stream = io.BytesIO(bad_value)
 
     with pytest.raises(MessageDecodeError):
-        decode_varint(stream)
+        decode_varint(bad_value)
 
 
 @pytest.mark.parametrize('data', [
@@ -53,11 +49,11 @@ def test_decode_varint_raises_when_max_data_length_exceeded():
 ])
 def test_encode_decode_bytes(data):
     encoded = encode_bytes(data)
-    stream = io.BytesIO(encoded)
-    bytes_read = decode_bytes(stream)
+    bytes_read, position = decode_bytes(encoded)
 
     assert bytes_read == data
     assert len(bytes_read) == len(data)
+    assert position == len(encoded)
 
 
 @pytest.mark.parametrize('string', [
@@ -70,9 +66,8 @@ def test_encode_decode_bytes(data):
 def test_read_string(string):
     data = string.encode('utf-8')
     length = encode_varint(len(data))
-    stream = io.BytesIO(length + data)
 
-    bytes_read = decode_bytes(stream)
+    bytes_read, _ = decode_bytes(length + data)
     assert bytes_read == data
 
     string_read = bytes_read.decode('utf-8')